@@ -1,19 +1,80 @@
 import requests
 import os
 import zipfile
+import shutil
+import tempfile
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 import sys
 import hashlib
-import glob
+import mmap
+import concurrent.futures
 import logging
 import argparse
 
+try:
+    # Optional: cryptography links against the platform OpenSSL and is
+    # guaranteed to pick up SHA-NI / AVX2 accelerated SHA-256 where the
+    # stdlib hashlib may have been built against a scalar backend.
+    from cryptography.hazmat.primitives import hashes as _crypto_hashes
+except ImportError:
+    _crypto_hashes = None
+
 # Set up logging
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
 
+def find_wasm_files(directory):
+    """Recursively collect .wasm paths under a directory.
+
+    Walks with os.scandir, which reuses the d_type from the directory
+    entries instead of the extra stat() per path that glob's recursive
+    matching incurs.
+    """
+    wasm_files = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".wasm") and entry.is_file():
+                    wasm_files.append(entry.path)
+    return wasm_files
+
+
+def sha256_file(path):
+    """Return the uppercase hex SHA-256 digest of a file.
+
+    Prefers the cryptography package when installed: it hashes through the
+    platform OpenSSL, which dispatches to SHA-NI / AVX2 where available,
+    feeding 1 MiB slices from a single mmap of the file. Otherwise uses
+    hashlib.file_digest (Python 3.11+), which reads in large buffers inside
+    C, instead of a Python-level read loop with small chunks. On older
+    Pythons, hash the whole file through a single mmap so the digest still
+    runs over one contiguous buffer.
+    """
+    # Empty files can't be mmap'd; hash them directly.
+    if os.path.getsize(path) == 0:
+        return hashlib.sha256(b"").hexdigest().upper()
+
+    with open(path, "rb") as f:
+        if _crypto_hashes is not None:
+            h = _crypto_hashes.Hash(_crypto_hashes.SHA256())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    block = 1 << 20
+                    for i in range(0, len(view), block):
+                        h.update(view[i : i + block])
+            return h.finalize().hex().upper()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest().upper()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest().upper()
+
+
 class GitHubArtifactsDownloader:
     def __init__(self, token, owner, repo):
         self.token = token
@@ -24,11 +85,16 @@ class GitHubArtifactsDownloader:
             "Accept": "application/vnd.github.v3+json",
         }
         self.api_base = "https://api.github.com"
+        # One session for all API calls: connections (and their TLS
+        # handshakes) are pooled and reused instead of re-established per
+        # request. requests.Session is thread-safe for concurrent gets.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def get_latest_workflow_run_id(self):
         url = f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/runs"
         logger.debug(f"Fetching latest workflow run from {url}")
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         runs = response.json()["workflow_runs"]
         if not runs:
@@ -39,63 +105,133 @@ class GitHubArtifactsDownloader:
     def get_workflow_run(self, run_id):
         url = f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}"
         logger.debug(f"Fetching workflow run details from {url}")
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()
 
     def get_artifacts_for_run(self, run_id):
         url = f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/artifacts"
         logger.debug(f"Fetching artifacts from {url}")
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()["artifacts"]
 
     def download_artifact(self, artifact_id, output_dir):
         url = f"{self.api_base}/repos/{self.owner}/{self.repo}/actions/artifacts/{artifact_id}/zip"
-        response = requests.get(url, headers=self.headers, stream=True)
-        response.raise_for_status()
 
         os.makedirs(output_dir, exist_ok=True)
-        zip_path = os.path.join(output_dir, f"artifact_{artifact_id}.zip")
-        logger.info(f"Downloading to {zip_path}...")
-
-        with open(zip_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-
-        logger.info("Extracting files...")
-        try:
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(output_dir)
-            logger.info(f"Files extracted to: {output_dir}")
-            self.print_wasm_checksums(output_dir)
-
-        except zipfile.BadZipFile:
-            logger.error(
-                "The downloaded file is not a valid zip file. Keeping the original downloaded file."
-            )
+        logger.info(f"Downloading artifact {artifact_id}...")
+
+        # Buffer the zip instead of round-tripping it through an
+        # artifact_<id>.zip on disk: the archive's central directory lives
+        # at its end, so it has to be fully downloaded before extraction
+        # anyway, and this skips one full write + read of the file.
+        # The spooled file keeps artifacts up to 64 MiB in memory and
+        # spills larger ones to a temp file, so concurrent downloads of
+        # big artifacts cannot pile up in RAM.
+        with tempfile.SpooledTemporaryFile(max_size=64 << 20) as buffer:
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                # Copy in 1 MiB blocks straight from the raw socket instead
+                # of iterating 8 KiB chunks in Python, cutting syscalls and
+                # interpreter round-trips for multi-MB artifacts.
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buffer, length=1024 * 1024)
+
+            logger.info("Extracting files...")
+            try:
+                with zipfile.ZipFile(buffer) as zip_ref:
+                    checksums = self.extract_with_checksums(zip_ref, output_dir)
+                logger.info(f"Files extracted to: {output_dir}")
+
+            except zipfile.BadZipFile:
+                # Keep the downloaded bytes on disk for inspection
+                zip_path = os.path.join(output_dir, f"artifact_{artifact_id}.zip")
+                buffer.seek(0)
+                with open(zip_path, "wb") as f:
+                    shutil.copyfileobj(buffer, f, length=1024 * 1024)
+                logger.error(
+                    "The downloaded file is not a valid zip file. Keeping the original downloaded file."
+                )
+                return None
+
+        return checksums
+
+    def extract_with_checksums(self, zip_ref, output_dir):
+        """Extract all zip members, hashing .wasm members in the same pass.
+
+        Fuses extraction and checksumming so wasm bytes are only moved
+        through memory once: each member is streamed through a single 1 MiB
+        buffer that is both written to disk and fed to the hash, instead of
+        extractall() followed by a re-read of every wasm from disk.
+        Returns {relative path: uppercase hex digest} for the wasm members.
+        """
+        checksums = {}
+        buf = bytearray(1 << 20)
+        for info in zip_ref.infolist():
+            # Sanitize member names like ZipFile._extract_member does:
+            # drop absolute prefixes and any '..' components so a
+            # malicious archive cannot write outside output_dir.
+            parts = [
+                p
+                for p in info.filename.split("/")
+                if p not in ("", ".", "..") and ":" not in p
+            ]
+            if not parts:
+                continue
+            rel_path = "/".join(parts)
+            dest = os.path.join(output_dir, *parts)
+            if info.is_dir():
+                os.makedirs(dest, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(dest) or output_dir, exist_ok=True)
+
+            sha256_hash = hashlib.sha256() if info.filename.endswith(".wasm") else None
+            with zip_ref.open(info) as src, open(dest, "wb") as dst:
+                while True:
+                    n = src.readinto(buf)
+                    if not n:
+                        break
+                    view = memoryview(buf)[:n]
+                    dst.write(view)
+                    if sha256_hash is not None:
+                        sha256_hash.update(view)
+
+            if sha256_hash is not None:
+                checksums[rel_path] = sha256_hash.hexdigest().upper()
+
+        return checksums
+
+    def print_checksums(self, checksums):
+        if not checksums:
+            logger.info("No .wasm files found in the artifacts.")
             return
 
-        os.remove(zip_path)
+        for rel_path in sorted(checksums):
+            logger.info(f"Data Hash {rel_path}: {checksums[rel_path]}")
+            # Keep stdout output for user visibility
+            print(f"Data Hash {rel_path}: {checksums[rel_path]}")
 
     def print_wasm_checksums(self, directory):
-        wasm_files = glob.glob(os.path.join(directory, "**", "*.wasm"), recursive=True)
+        wasm_files = find_wasm_files(directory)
 
         if not wasm_files:
             logger.info("No .wasm files found in the artifacts.")
             return
 
-        for wasm_file in sorted(wasm_files):
-            sha256_hash = hashlib.sha256()
-            with open(wasm_file, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+        # SHA-256 updates run in C with the GIL released, so hashing the
+        # files on a thread pool scales until memory bandwidth saturates.
+        files = sorted(wasm_files)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(files), os.cpu_count() or 1)
+        ) as executor:
+            digests = executor.map(sha256_file, files)
 
+        for wasm_file, digest in zip(files, digests):
             rel_path = os.path.relpath(wasm_file, directory)
-            logger.info(f"Data Hash {rel_path}: {sha256_hash.hexdigest().upper()}")
+            logger.info(f"Data Hash {rel_path}: {digest}")
             # Keep stdout output for user visibility
-            print(f"Data Hash {rel_path}: {sha256_hash.hexdigest().upper()}")
+            print(f"Data Hash {rel_path}: {digest}")
 
 
 def parse_github_url(url):
@@ -144,12 +280,27 @@ def main():
             logger.info("No artifacts found for this workflow run")
             return
 
-        for artifact in artifacts:
-            logger.info(
-                f"\nFound artifact: {artifact['name']} (Size: {artifact['size_in_bytes']} bytes)"
-            )
-            output_dir = f"artifacts/{run_id}/{artifact['name']}"
-            downloader.download_artifact(artifact["id"], output_dir)
+        # Downloads are network/disk bound, so overlap them on a thread
+        # pool; results are printed in the original artifact order.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(artifacts), os.cpu_count() or 1)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    downloader.download_artifact,
+                    artifact["id"],
+                    f"artifacts/{run_id}/{artifact['name']}",
+                )
+                for artifact in artifacts
+            ]
+
+            for artifact, future in zip(artifacts, futures):
+                logger.info(
+                    f"\nFound artifact: {artifact['name']} (Size: {artifact['size_in_bytes']} bytes)"
+                )
+                checksums = future.result()
+                if checksums is not None:
+                    downloader.print_checksums(checksums)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Error occurred: {e}")
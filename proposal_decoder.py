@@ -1,20 +1,29 @@
 import base64
+import functools
+import json
 import requests
 import logging
 import os
 import argparse
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
-from borsh_construct import (
-    CStruct,
-    String,
-    U8,
-    U64,
-    Option as BorshOption,
-    TupleStruct,
-    HashMap,
-    Enum,
-)
+try:
+    # Optional: used to vectorize the byte -> 5-bit word conversion.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: JIT-compiles the bech32 checksum kernel.
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # Optional: C-level JSON decoding for RPC responses.
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.ERROR)
@@ -39,14 +48,36 @@ ESTABLISHED_ADDRESS_BYTES_LEN = 21
 
 # Constants from Rust bech32 implementation
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+# 256-byte table mapping each 5-bit word value to its CHARSET byte, so a
+# whole word sequence can be rendered with one bytes.translate call.
+CHARSET_TABLE = CHARSET.encode("ascii") + bytes(256 - len(CHARSET))
 BECH32M_CONST = 0x2BC830A3
 CHECKSUM_LENGTH = 6
 GENERATOR = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
+# 32-entry fold table: entry t is the xor of every GENERATOR[i] whose bit is
+# set in t, so the polymod inner loop collapses to one lookup on the 5 top
+# bits instead of five test-and-xor iterations.
+GENERATOR_FOLD = tuple(
+    functools.reduce(
+        lambda acc, i: acc ^ (GENERATOR[i] if (t >> i) & 1 else 0), range(5), 0
+    )
+    for t in range(32)
+)
 HASH_LEN = 20
 ADDR_ENCODING_LEN = 1 + HASH_LEN
 
-# Define Address types
-internal_address = Enum(
+# The address HRP is a constant, so its expanded form is precomputed once
+# instead of being rebuilt character by character on every encode.
+ADDRESS_HRP = "tnam"
+# Zero discriminant prepended to the 20-byte hash; encodes to 'q' in base32
+_ADDR_PREFIX = bytes(ADDR_ENCODING_LEN - HASH_LEN)
+_ADDRESS_HRP_EXPANDED = tuple(
+    [ord(x) >> 5 for x in ADDRESS_HRP] + [0] + [ord(x) & 31 for x in ADDRESS_HRP]
+)
+
+# Borsh enum variant names, indexed by their serialized u8 tag.
+# Matches the Rust InternalAddress / Address / ProposalType definitions.
+INTERNAL_ADDRESS_VARIANTS = (
     "Implicit",
     "Established",
     "Pos",
@@ -58,45 +89,18 @@ internal_address = Enum(
     "BridgePool",
     "Multitoken",
     "Pgf",
-    "Erc20" / TupleStruct(U8[20]),  # ETH address is 20 bytes
-    "Nut" / TupleStruct(U8[20]),
-    "IbcToken" / TupleStruct(U8[20]),
+    "Erc20",  # ETH address is 20 bytes
+    "Nut",
+    "IbcToken",
     "Masp",
     "TempStorage",
     "ReplayProtection",
-    enum_name="InternalAddress",
 )
+# Internal address variants that carry a 20-byte payload
+INTERNAL_ADDRESS_WITH_HASH = {"Erc20", "Nut", "IbcToken"}
 
-address = Enum(
-    "Internal" / TupleStruct(internal_address),
-    "Established" / TupleStruct(U8[20]),  # 20 byte hash
-    "Implicit" / TupleStruct(U8[20]),  # 20 byte hash
-    enum_name="Address",
-)
-
-# Define ProposalType enum
-proposal_type = Enum(
-    "Default",
-    "DefaultWithWasm" / TupleStruct(U8[SHA_HASH_LEN]),  # 32 byte hash
-    # Note: Simplified PGFSteward and PGFPayment for now as they're complex types
-    "PGFSteward",
-    "PGFPayment",
-    enum_name="ProposalType",
-)
-
-# Define StorageProposal struct
-storage_proposal = CStruct(
-    "id" / U64,
-    "content" / HashMap(String, String),
-    "author" / address,
-    "type" / proposal_type,
-    "voting_start_epoch" / U64,
-    "voting_end_epoch" / U64,
-    "activation_epoch" / U64,
-)
-
-# Wrap StorageProposal in Option since that's how it's returned from RPC
-optional_storage_proposal = BorshOption(storage_proposal)
+ADDRESS_VARIANTS = ("Internal", "Established", "Implicit")
+PROPOSAL_TYPE_VARIANTS = ("Default", "DefaultWithWasm", "PGFSteward", "PGFPayment")
 
 
 class ProposalStatus:
@@ -122,9 +126,14 @@ def print_bytes(label: str, data: bytes):
     print(f"{label}: {' '.join(f'{b:02x}' for b in data)}")
 
 
-def bech32_encode_bytes(payload_bytes: bytes, hrp: str = "tnam") -> str:
+@functools.lru_cache(maxsize=1024)
+def bech32_encode_bytes(payload_bytes: bytes, hrp: str = ADDRESS_HRP) -> str:
     """Encode bytes using bech32m format.
 
+    Results are memoized on (payload_bytes, hrp): the same author address
+    shows up across proposals, so repeat encodings become a dict lookup.
+    Callers must pass an immutable bytes payload.
+
     Follows Rust implementation:
     ```rust
     impl string_encoding::Format for Address {
@@ -139,18 +148,66 @@ def bech32_encode_bytes(payload_bytes: bytes, hrp: str = "tnam") -> str:
     return create_bech32m_string(hrp, base32_words)
 
 
-def bech32_polymod(values: List[int]) -> int:
-    """Internal function that computes the Bech32 checksum."""
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
+def _bech32_polymod_kernel(values):
     chk = 1
     for value in values:
         top = chk >> 25
-        chk = (chk & 0x1FFFFFF) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1FFFFFF) << 5 ^ value ^ GENERATOR_FOLD[top]
+    return chk
+
+
+if njit is not None:
+    _bech32_polymod_kernel = njit(cache=True)(_bech32_polymod_kernel)
+
+
+def _bech32_checksum_kernel(hrp_bytes, data):
+    """Fold the expanded HRP, data words and 6 zero sentinels through the
+    bech32 polymod in one pass, without materializing the combined list."""
+    chk = 1
+    n = len(hrp_bytes)
+    for k in range(2 * n + len(data) + 7):
+        if k < n:
+            value = hrp_bytes[k] >> 5
+        elif k == n:
+            value = 0
+        elif k < 2 * n + 1:
+            value = hrp_bytes[k - n - 1] & 31
+        elif k < 2 * n + 1 + len(data):
+            value = data[k - 2 * n - 1]
+        else:
+            value = 0
+        top = chk >> 25
+        chk = (chk & 0x1FFFFFF) << 5 ^ value ^ GENERATOR_FOLD[top]
     return chk
 
 
+if njit is not None:
+    _bech32_checksum_kernel = njit(cache=True)(_bech32_checksum_kernel)
+
+
+@functools.lru_cache(maxsize=8)
+def _hrp_kernel_arg(hrp: str):
+    """HRP byte values in the form the checksum kernel consumes.
+
+    Cached so the constant "tnam" HRP is encoded (and, under numba,
+    converted to an int64 array) exactly once.
+    """
+    if njit is not None and np is not None:
+        return np.frombuffer(hrp.encode("ascii"), dtype=np.uint8).astype(np.int64)
+    return hrp.encode("ascii")
+
+
+def bech32_polymod(values: List[int]) -> int:
+    """Internal function that computes the Bech32 checksum.
+
+    The kernel is JIT-compiled with numba when available (all values fit
+    comfortably in 64-bit machine ints); otherwise it runs as plain Python.
+    """
+    if njit is not None and np is not None:
+        return int(_bech32_polymod_kernel(np.asarray(values, dtype=np.int64)))
+    return _bech32_polymod_kernel(values)
+
+
 def bytes_to_base32_words(data: bytes) -> List[int]:
     """Convert bytes to 5-bit base32 words.
 
@@ -178,19 +235,26 @@ def bytes_to_base32_words(data: bytes) -> List[int]:
     ```
     """
     logger.debug(f"Converting bytes to base32: {data.hex()}")
-    words = []
-    value = 0
-    bits = 0
-
-    for byte in data:
-        value = (value << 8) | byte
-        bits += 8
-        while bits >= 5:
-            bits -= 5
-            words.append((value >> bits) & 31)
-
-    if bits > 0:
-        words.append((value << (5 - bits)) & 31)
+    if np is not None:
+        # Vectorized: unpack to a bit vector (MSB first), zero-pad to a
+        # multiple of 5, and fold each 5-bit group back into a word —
+        # the same regrouping as the accumulator loop below, done in C.
+        bits_arr = np.unpackbits(np.frombuffer(bytes(data), dtype=np.uint8))
+        pad = -len(bits_arr) % 5
+        if pad:
+            bits_arr = np.append(bits_arr, np.zeros(pad, dtype=np.uint8))
+        words = (bits_arr.reshape(-1, 5) * np.array([16, 8, 4, 2, 1])).sum(axis=1)
+        words = words.tolist()
+        logger.debug(f"Base32 words: {words}")
+        return words
+
+    # Fallback: load the whole payload into one big int and slice 5-bit
+    # groups off it, replacing the per-byte shift/mask accumulator with
+    # C-level bignum ops.
+    pad = -(len(data) * 8) % 5
+    acc = int.from_bytes(data, "big") << pad
+    count = (len(data) * 8 + pad) // 5
+    words = [(acc >> 5 * (count - 1 - i)) & 31 for i in range(count)]
 
     logger.debug(f"Base32 words: {words}")
     return words
@@ -216,11 +280,21 @@ def create_bech32m_string(hrp: str, data: List[int]) -> str:
     }
     ```
     """
-    expanded_hrp = expand_hrp(hrp)
-    combined = expanded_hrp + data
-    checksum = create_checksum(combined)
+    # Checksum is computed by a fused kernel that streams the expanded HRP,
+    # the data words and the zero sentinels through the polymod directly,
+    # instead of building expand_hrp(hrp) + data + [0] * 6 first.
+    if njit is not None and np is not None:
+        polymod = int(
+            _bech32_checksum_kernel(
+                _hrp_kernel_arg(hrp), np.asarray(data, dtype=np.int64)
+            )
+        )
+    else:
+        polymod = _bech32_checksum_kernel(_hrp_kernel_arg(hrp), data)
+    polymod ^= BECH32M_CONST
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
-    return f"{hrp}1" + "".join(CHARSET[d] for d in data + checksum)
+    return f"{hrp}1" + bytes(data + checksum).translate(CHARSET_TABLE).decode("ascii")
 
 
 def expand_hrp(hrp: str) -> List[int]:
@@ -237,6 +311,8 @@ def expand_hrp(hrp: str) -> List[int]:
     }
     ```
     """
+    if hrp == ADDRESS_HRP:
+        return list(_ADDRESS_HRP_EXPANDED)
     logger.debug(f"Expanding HRP: {hrp}")
     result = [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
     logger.debug(f"Expanded HRP: {result}")
@@ -272,26 +348,26 @@ def format_address(addr) -> str:
     }
     ```
     """
-    if isinstance(addr, address.enum.Internal):
-        return f"Internal({addr.tuple_data[0].__class__.__name__})"
-
-    elif isinstance(addr, address.enum.Established):
-        raw_bytes = bytes(addr.tuple_data[0])
-        addr_bytes = bytearray(ADDR_ENCODING_LEN)
-        addr_bytes[0] = 0  # Leading zero encodes to 'q' in base32
-        addr_bytes[1:] = raw_bytes
-        return bech32_encode_bytes(addr_bytes)
-
-    elif isinstance(addr, address.enum.Implicit):
-        raw_bytes = bytes(addr.tuple_data[0])
-        addr_bytes = bytearray(ADDR_ENCODING_LEN)
-        addr_bytes[0] = 0
-        addr_bytes[1:] = raw_bytes
-        return bech32_encode_bytes(addr_bytes)
+    variant, payload = addr
+
+    if variant == "Internal":
+        return f"Internal({payload})"
+
+    elif variant in ("Established", "Implicit"):
+        # Single C-level concat with the preallocated zero prefix instead
+        # of filling a fresh bytearray per call
+        return bech32_encode_bytes(_ADDR_PREFIX + payload)
 
     return "Unknown Address Type"
 
 
+def _decode_json(response):
+    """Decode an RPC response body, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def fetch_proposal_data(proposal_id: int, node_url: str = RPC_URL) -> str:
     """Fetch proposal data from the RPC endpoint."""
     url = f"{node_url}/abci_query"
@@ -306,52 +382,184 @@ def fetch_proposal_data(proposal_id: int, node_url: str = RPC_URL) -> str:
     if response.status_code != 200:
         raise ValueError(f"Error fetching data: HTTP {response.status_code}")
 
-    result = response.json()
+    result = _decode_json(response)
     return result["result"]["response"]["value"]
 
 
+def fetch_proposal_and_epoch(proposal_id: int, node_url: str = RPC_URL) -> tuple:
+    """Fetch proposal data and the current epoch in one round trip.
+
+    CometBFT's RPC accepts JSON-RPC 2.0 batches over POST, so both
+    abci_query calls travel in a single HTTP request instead of two
+    sequential GETs. Returns (value_base64, current_epoch).
+    """
+    batch = [
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "abci_query",
+            "params": {
+                "path": f"/vp/governance/proposal/{proposal_id}",
+                "data": "",
+                "prove": False,
+            },
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "abci_query",
+            "params": {"path": "/shell/epoch", "data": "", "prove": False},
+        },
+    ]
+
+    logger.debug("Fetching proposal data and epoch in one batch...")
+    response = requests.post(node_url, json=batch)
+    if response.status_code != 200:
+        raise ValueError(f"Error fetching data: HTTP {response.status_code}")
+
+    # Batch responses may arrive in any order; match them back up by id.
+    by_id = {item["id"]: item for item in _decode_json(response)}
+    value_base64 = by_id[1]["result"]["response"]["value"]
+    epoch_base64 = by_id[2]["result"]["response"]["value"]
+    epoch, _ = _read_u64(base64.b64decode(epoch_base64), 0)
+
+    return value_base64, epoch
+
+
+def _read_u32(data: bytes, offset: int):
+    return int.from_bytes(data[offset : offset + 4], "little"), offset + 4
+
+
+def _read_u64(data: bytes, offset: int):
+    return int.from_bytes(data[offset : offset + 8], "little"), offset + 8
+
+
+def _read_string(data: bytes, offset: int):
+    """Read a borsh string: u32 length followed by UTF-8 bytes."""
+    length, offset = _read_u32(data, offset)
+    return data[offset : offset + length].decode("utf-8"), offset + length
+
+
+def _read_address(data: bytes, offset: int):
+    """Read a borsh Address enum as a (variant, payload) pair.
+
+    Internal addresses carry the variant name of the inner InternalAddress
+    as payload; Established/Implicit carry their 20-byte hash.
+    """
+    tag = data[offset]
+    offset += 1
+    if tag >= len(ADDRESS_VARIANTS):
+        raise ValueError(f"Unknown address tag: {tag}")
+    variant = ADDRESS_VARIANTS[tag]
+
+    if variant == "Internal":
+        inner_tag = data[offset]
+        offset += 1
+        if inner_tag >= len(INTERNAL_ADDRESS_VARIANTS):
+            raise ValueError(f"Unknown internal address tag: {inner_tag}")
+        inner = INTERNAL_ADDRESS_VARIANTS[inner_tag]
+        if inner in INTERNAL_ADDRESS_WITH_HASH:
+            offset += HASH_LEN
+        return (variant, inner), offset
+
+    payload = data[offset : offset + HASH_LEN]
+    return (variant, payload), offset + HASH_LEN
+
+
+def _read_proposal_type(data: bytes, offset: int):
+    """Read a borsh ProposalType enum as a (variant, payload) pair."""
+    tag = data[offset]
+    offset += 1
+    if tag >= len(PROPOSAL_TYPE_VARIANTS):
+        raise ValueError(f"Unknown proposal type tag: {tag}")
+    variant = PROPOSAL_TYPE_VARIANTS[tag]
+
+    if variant == "DefaultWithWasm":
+        payload = data[offset : offset + SHA_HASH_LEN]
+        return (variant, payload), offset + SHA_HASH_LEN
+    return (variant, None), offset
+
+
+def parse_storage_proposal(data: bytes) -> Optional[Dict]:
+    """Decode a borsh Option<StorageProposal> into native Python values.
+
+    Hand-rolled replacement for the borsh-construct schema: the layout is
+    fixed (u64 id, HashMap<String, String> content, Address author,
+    ProposalType type, three u64 epochs), so a cursor over the buffer with
+    int.from_bytes does the job without per-field construct dispatch.
+    Returns None for Option::None.
+    """
+    if data[0] == 0:
+        return None
+    offset = 1
+
+    proposal_id, offset = _read_u64(data, offset)
+
+    entry_count, offset = _read_u32(data, offset)
+    content = {}
+    for _ in range(entry_count):
+        key, offset = _read_string(data, offset)
+        value, offset = _read_string(data, offset)
+        content[key] = value
+
+    author, offset = _read_address(data, offset)
+    ptype, offset = _read_proposal_type(data, offset)
+    voting_start_epoch, offset = _read_u64(data, offset)
+    voting_end_epoch, offset = _read_u64(data, offset)
+    activation_epoch, offset = _read_u64(data, offset)
+
+    return {
+        "id": proposal_id,
+        "content": content,
+        "author": author,
+        "type": ptype,
+        "voting_start_epoch": voting_start_epoch,
+        "voting_end_epoch": voting_end_epoch,
+        "activation_epoch": activation_epoch,
+    }
+
+
 def parse_proposal_data(value_base64: str) -> Dict:
-    """Parse the base64 encoded proposal data using borsh-construct."""
+    """Parse the base64 encoded proposal data."""
     decoded_value = base64.b64decode(value_base64)
     logger.debug(
         f"Decoded proposal data ({len(decoded_value)} bytes): {decoded_value.hex()}"
     )
 
     # Parse the Option<StorageProposal>
-    result = optional_storage_proposal.parse(decoded_value)
+    result = parse_storage_proposal(decoded_value)
     if result is None:
         raise ValueError("Proposal not found (Option::None)")
 
     # Convert the parsed data into a more friendly format
     proposal_data = {
-        "Proposal Id": result.id,
-        "Content": dict(result.content),  # Convert from Container to dict
-        "Author": format_address(result.author),
-        "Type": format_proposal_type(result.type),
-        "Voting Start Epoch": result.voting_start_epoch,
-        "Voting End Epoch": result.voting_end_epoch,
-        "Activation Epoch": result.activation_epoch,
+        "Proposal Id": result["id"],
+        # Already a native dict straight from the decoder; no copy needed
+        "Content": result["content"],
+        "Author": format_address(result["author"]),
+        "Type": format_proposal_type(result["type"]),
+        "Voting Start Epoch": result["voting_start_epoch"],
+        "Voting End Epoch": result["voting_end_epoch"],
+        "Activation Epoch": result["activation_epoch"],
     }
 
     # Add wasm hash if present
-    if isinstance(result.type, proposal_type.enum.DefaultWithWasm):
-        proposal_data["Data Hash"] = bytes(result.type.tuple_data[0]).hex().upper()
+    type_variant, type_payload = result["type"]
+    if type_variant == "DefaultWithWasm":
+        proposal_data["Data Hash"] = type_payload.hex().upper()
 
     return proposal_data
 
 
 def format_proposal_type(ptype) -> str:
     """Format proposal type into human readable form."""
-    if isinstance(ptype, proposal_type.enum.Default):
-        return "Default"
-    elif isinstance(ptype, proposal_type.enum.DefaultWithWasm):
-        return "Default with Wasm"
-    elif isinstance(ptype, proposal_type.enum.PGFSteward):
-        return "PGF Steward"
-    elif isinstance(ptype, proposal_type.enum.PGFPayment):
-        return "PGF Payment"
-    else:
-        return "Unknown Type"
+    variant, _ = ptype
+    return {
+        "Default": "Default",
+        "DefaultWithWasm": "Default with Wasm",
+        "PGFSteward": "PGF Steward",
+        "PGFPayment": "PGF Payment",
+    }.get(variant, "Unknown Type")
 
 
 def get_proposal_status(proposal: Dict, current_epoch: int) -> ProposalStatus:
@@ -383,12 +591,12 @@ def fetch_current_epoch(node_url: str = RPC_URL) -> int:
     if response.status_code != 200:
         raise ValueError(f"Error fetching epoch: HTTP {response.status_code}")
 
-    result = response.json()
+    result = _decode_json(response)
     value_base64 = result["result"]["response"]["value"]
 
     # Decode the base64 value and interpret as u64
     decoded_value = base64.b64decode(value_base64)
-    epoch = U64.parse(decoded_value)
+    epoch, _ = _read_u64(decoded_value, 0)
 
     return epoch
 
@@ -403,10 +611,12 @@ def display_proposal(proposal_data: Dict, current_epoch: int, status: str):
     print(f"Type: {proposal_data['Type']}")
     print(f"Author: {proposal_data['Author']}")
 
-    # Format content as a single-line JSON-like string
-    content = proposal_data["Content"]
-    content_str = "{" + ", ".join(f'"{k}": "{v}"' for k, v in content.items()) + "}"
-    print(f"Content: {content_str}")
+    # Format content as single-line JSON; json.dumps' default separators
+    # match the previous hand-built string and render in one C call
+    # (and, unlike the old generator, escape quotes inside values).
+    # ensure_ascii=False keeps non-ASCII proposal text as raw UTF-8,
+    # as the baseline printed it.
+    print(f"Content: {json.dumps(proposal_data['Content'], ensure_ascii=False)}")
 
     # Print epochs using CLI naming
     print(f"Start Epoch: {proposal_data['Voting Start Epoch']}")
@@ -442,10 +652,8 @@ def main():
         print("Warning: .env file not found. Using default RPC URL:", DEFAULT_RPC_URL)
 
     try:
-        # First fetch the current epoch
-        current_epoch = fetch_current_epoch()
-        # Then fetch and parse the proposal
-        value_base64 = fetch_proposal_data(args.proposal_id)
+        # Fetch the proposal and the current epoch in a single batched call
+        value_base64, current_epoch = fetch_proposal_and_epoch(args.proposal_id)
         proposal_data = parse_proposal_data(value_base64)
         status = get_proposal_status(proposal_data, current_epoch)
 